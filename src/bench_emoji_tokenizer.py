@@ -0,0 +1,123 @@
+"""
+bench_emoji_tokenizer.py
+-----------------------
+Desafío de Ingeniero de Datos - Benchmark de tokenizadores de emoji
+
+Autor: Diego Mendez
+Fecha: 21-11-2025
+Descripción:
+    Compara tres estrategias para extraer secuencias emoji del contenido
+    de los tweets, todas con la misma semántica (emoji base, selector de
+    variación FE0F opcional y secuencias ZWJ encadenadas):
+
+      1. regex:  patrón \\p{Emoji_Presentation}/\\p{Extended_Pictographic}
+                 con el módulo `regex` (motor NFA, re-entra por emoji)
+      2. set:    escaneo por codepoint con lookup en el frozenset EMOJI_CP
+                 (hash por carácter no-ASCII)
+      3. tabla:  DFA con tabla de clasificación `bytes` indexada por
+                 codepoint — clases {otro, emoji, ZWJ, VS16} — donde cada
+                 consulta es una indexación C sin hashing
+
+    La tabla ocupa ~1.1MB por proceso (0x110000 entradas de 1 byte) y se
+    construye una sola vez al importar q2_memory.
+
+Uso:
+    python bench_emoji_tokenizer.py [ruta_al_json]
+
+    Sin argumento usa src/farmers-protest-tweets-2021-2-4.json si existe;
+    de lo contrario genera contenido sintético representativo (mayoría
+    ASCII, ~30% de tweets con 1-3 emojis).
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import regex
+
+from q2_memory import _extract_emojis, _extract_emojis_table, _parse
+
+
+# Patrón original de la solución basada en regex (referencia semántica)
+EMOJI_PATTERN = regex.compile(
+    r'[\p{Emoji_Presentation}\p{Extended_Pictographic}]'
+    r'(?:\uFE0F)?'
+    r'(?:\u200D[\p{Emoji_Presentation}\p{Extended_Pictographic}]\uFE0F?)*',
+    flags=regex.UNICODE
+)
+
+
+def _load_contents(file_path: str) -> list:
+    """Extrae el campo content de cada línea del archivo JSON."""
+    contents = []
+    with open(file_path, 'rb') as f:
+        for line in f:
+            try:
+                tweet = _parse(line)
+                content = tweet.get('content', '') or tweet.get('renderedContent', '')
+                if content:
+                    contents.append(str(content))
+            except (ValueError, KeyError, TypeError):
+                continue
+            finally:
+                tweet = None
+    return contents
+
+
+def _synthetic_contents(n: int = 50000) -> list:
+    """Genera contenido representativo: mayoría ASCII, ~30% con emojis."""
+    rng = random.Random(42)
+    emojis = ['🙏', '😂', '🚜', '✊', '❤️', '👨‍🌾', '🇮🇳']
+    words = ['support', 'farmers', 'protest', 'india', 'tractor', 'delhi']
+    contents = []
+    for _ in range(n):
+        text = ' '.join(rng.choices(words, k=rng.randint(5, 20)))
+        if rng.random() < 0.3:
+            text += ' ' + ' '.join(rng.choices(emojis, k=rng.randint(1, 3)))
+        contents.append(text)
+    return contents
+
+
+def _bench(label: str, fn, contents: list, repeats: int = 3) -> float:
+    """Cronometra fn sobre todos los contenidos; retorna el mejor tiempo."""
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for content in contents:
+            fn(content)
+        best = min(best, time.perf_counter() - t0)
+    print(f'  {label:<22} {best:8.3f}s')
+    return best
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        data_path = sys.argv[1]
+    else:
+        default = Path(__file__).parent / 'farmers-protest-tweets-2021-2-4.json'
+        data_path = str(default) if default.exists() else None
+
+    if data_path:
+        print(f'Cargando contenidos desde {data_path} ...')
+        contents = _load_contents(data_path)
+    else:
+        print('Dataset no encontrado: usando contenido sintético')
+        contents = _synthetic_contents()
+    print(f'{len(contents)} contenidos\n')
+
+    # Verificar equivalencia semántica antes de medir
+    for content in contents[:5000]:
+        expected = EMOJI_PATTERN.findall(content)
+        assert _extract_emojis(content) == expected, content
+        assert _extract_emojis_table(content) == expected, content
+    print('Equivalencia semántica verificada (primeros 5000 contenidos)\n')
+
+    print('Tiempos (mejor de 3 pasadas):')
+    _bench('regex (NFA)', EMOJI_PATTERN.findall, contents)
+    _bench('set (EMOJI_CP)', _extract_emojis, contents)
+    _bench('tabla (bytes DFA)', _extract_emojis_table, contents)
+
+
+if __name__ == '__main__':
+    main()
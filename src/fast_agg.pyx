@@ -0,0 +1,155 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+fast_agg.pyx
+-----------
+Desafío de Ingeniero de Datos - Fast path compilado para las soluciones
+optimizadas en memoria (opcional)
+
+Autor: Diego Mendez
+Fecha: 21-11-2025
+Descripción:
+    Versión compilada (Cython) del loop caliente de q1_memory y q3_memory.
+    El recorrido por líneas opera sobre un mmap del archivo con búsquedas
+    de '\\n' a velocidad C (mmap.find usa memchr), y el cuerpo del loop
+    corre sin despacho de bytecode del intérprete. El parseo JSON sigue
+    siendo simdjson (lazy), igual que en el fallback puro Python.
+
+Compilación (opcional; q1/q3_memory funcionan sin este módulo):
+    cd src && python setup_fast_agg.py build_ext --inplace
+
+Dependencias:
+    - cython >= 3.0 (solo para compilar)
+    - pysimdjson >= 5.0
+"""
+
+import mmap
+from collections import Counter
+
+import simdjson
+
+
+# Parser propio del módulo compilado; cada proceso worker tiene el suyo
+PARSER = simdjson.Parser()
+
+
+def scan_q1(str file_path, Py_ssize_t start, Py_ssize_t end):
+    """
+    Agrega (fecha, usuario) del rango de bytes [start, end) del archivo.
+
+    Semántica idéntica a q1_memory._scan_chunk: descarta la línea parcial
+    al inicio del rango y consume completa la línea que cruza 'end'.
+
+    Retorna:
+        Tupla (Counter por fecha, dict plano (fecha, usuario) -> conteo).
+    """
+    cdef Py_ssize_t pos, nl, size
+
+    date_counts = Counter()
+    user_counts = {}
+
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = mm.size()
+            if end > size:
+                end = size
+
+            pos = start
+            if start and mm[start - 1:start] != b'\n':
+                # Descartar la línea parcial: pertenece al chunk anterior.
+                # Si el rango empieza justo en un inicio de línea (el byte
+                # anterior es '\n'), la línea es de este chunk y se procesa
+                nl = mm.find(b'\n', pos)
+                pos = size if nl < 0 else nl + 1
+
+            while pos < end:
+                nl = mm.find(b'\n', pos)
+                if nl < 0:
+                    nl = size
+                line = mm[pos:nl]
+                pos = nl + 1
+
+                tweet = None
+                try:
+                    tweet = PARSER.parse(line)
+                    # Indexación directa: el except KeyError cubre la
+                    # ausencia de campos, sin cadena de .get por línea
+                    date_key = tweet['date'][:10]
+                    # Validar la forma 'YYYY-MM-DD': una fecha mal
+                    # formada no debe contar ni llegar a la conversión
+                    # final con int()/date() en el proceso padre
+                    if (len(date_key) != 10
+                            or date_key[4] != '-' or date_key[7] != '-'
+                            or not date_key[:4].isdecimal()
+                            or not date_key[5:7].isdecimal()
+                            or not date_key[8:10].isdecimal()):
+                        continue
+                    username = tweet['user']['username']
+                    if not username:
+                        continue
+                    date_counts[date_key] += 1
+                    pair = (date_key, username)
+                    user_counts[pair] = user_counts.get(pair, 0) + 1
+                except (ValueError, KeyError, TypeError):
+                    continue
+                finally:
+                    tweet = None
+
+    return date_counts, user_counts
+
+
+def scan_q3(str file_path, Py_ssize_t start, Py_ssize_t end):
+    """
+    Cuenta menciones (mentionedUsers) del rango de bytes [start, end).
+
+    Semántica idéntica a q3_memory._scan_chunk.
+
+    Retorna:
+        Counter con los conteos de menciones por username del rango.
+    """
+    cdef Py_ssize_t pos, nl, size
+
+    mention_counter = Counter()
+
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = mm.size()
+            if end > size:
+                end = size
+
+            pos = start
+            if start and mm[start - 1:start] != b'\n':
+                # Descartar la línea parcial: pertenece al chunk anterior.
+                # Si el rango empieza justo en un inicio de línea (el byte
+                # anterior es '\n'), la línea es de este chunk y se procesa
+                nl = mm.find(b'\n', pos)
+                pos = size if nl < 0 else nl + 1
+
+            while pos < end:
+                nl = mm.find(b'\n', pos)
+                if nl < 0:
+                    nl = size
+                line = mm[pos:nl]
+                pos = nl + 1
+
+                tweet = mentioned_users = user = None
+                try:
+                    tweet = PARSER.parse(line)
+                    mentioned_users = tweet.get('mentionedUsers')
+                    if mentioned_users:
+                        for user in mentioned_users:
+                            # Saltar elementos que no son objetos (p. ej.
+                            # ["foo"]) sin abortar la línea; hasattr
+                            # funciona sobre dicts y proxies de simdjson
+                            if not hasattr(user, 'get'):
+                                continue
+                            username = user.get('username')
+                            if username:
+                                mention_counter[username] += 1
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # AttributeError cubre líneas cuyo JSON de nivel
+                    # superior no es un objeto (tweet.get no existe)
+                    continue
+                finally:
+                    tweet = mentioned_users = user = None
+
+    return mention_counter
@@ -11,25 +11,167 @@ Descripción:
     prioriza un uso mínimo de memoria utilizando procesamiento en streaming.
 
 Características de Rendimiento:
-    - Complejidad de Tiempo: O(n) con una pasada en streaming
-    - Complejidad de Espacio: O(d * u) donde d=fechas, u=usuarios únicos por fecha
-    - Tiempo de ejecución esperado: ~4-5s para 117K tweets
-    - Uso de Memoria: ~5-10MB
+    - Complejidad de Tiempo: O(n / p) con p workers sobre rangos de bytes
+    - Complejidad de Espacio: O(d * u) por worker, donde d=fechas,
+      u=usuarios únicos por fecha (solo conteos agregados, nunca tweets)
+    - Tiempo de ejecución esperado: ~1-2s para 117K tweets (multicore)
+    - Uso de Memoria: ~5-10MB por worker
 
 Dependencias:
-    - Solo librerías estándar de Python
+    - pysimdjson >= 5.0 (parseo JSON con SIMD; fallback opcional a
+      orjson o json de la stdlib si no está instalado)
 
 Referencias:
+    - simdjson: https://github.com/simdjson/simdjson
     - Especificación del desafío: Ver sección 1 de README.md
 """
 
-from typing import List, Tuple
-from datetime import datetime
-from collections import defaultdict, Counter
-import json
+from typing import Dict, List, Tuple
+from datetime import date
+from collections import Counter
+from heapq import nlargest
+from multiprocessing import Pool
+from operator import itemgetter
+import mmap
+import os
 
+# Cadena de parsers por preferencia: pysimdjson (lazy, SIMD) -> orjson
+# (Rust, retorna dicts nativos, 2-3x más rápido que la stdlib) -> json.
+# Los tres aceptan bytes y el resto del código no distingue: el acceso
+# por índice funciona igual sobre proxies lazy que sobre dicts, y
+# orjson.JSONDecodeError subclasea ValueError, así que el except del
+# hot loop no cambia. El Parser de simdjson se instancia una vez por
+# módulo (cada worker obtiene el suyo al importar) y conserva su buffer
+# interno entre líneas.
+try:
+    import simdjson
+    _parse = simdjson.Parser().parse
+except ImportError:
+    try:
+        import orjson
+        _parse = orjson.loads
+    except ImportError:
+        import json
+        _parse = json.loads
 
-def q1_memory(file_path: str) -> List[Tuple[datetime.date, str]]:
+# Fast path compilado opcional (Cython): mismo algoritmo sin despacho de
+# bytecode y con búsqueda de líneas sobre mmap a velocidad C. Se compila
+# con `python setup_fast_agg.py build_ext --inplace`; si no está
+# disponible se usa el fallback puro Python de _scan_chunk.
+try:
+    import fast_agg
+except ImportError:
+    fast_agg = None
+
+
+def _chunk_bounds(file_path: str, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Divide el archivo en n_chunks rangos de bytes contiguos [inicio, fin).
+
+    Los límites no caen necesariamente en saltos de línea: cada worker
+    descarta la línea parcial al inicio de su rango y procesa toda línea
+    que comience dentro de él, de modo que cada línea se cuenta una vez.
+    """
+    size = os.path.getsize(file_path)
+    step = max(1, size // n_chunks)
+    offsets = list(range(0, size, step)) + [size]
+    return list(zip(offsets[:-1], offsets[1:]))
+
+
+def _scan_chunk(file_path: str, start: int, end: int) -> Tuple[Counter, Dict[Tuple[str, str], int]]:
+    """
+    Agrega el rango de bytes [start, end) del archivo en contadores parciales.
+
+    Procesa las líneas que comienzan dentro del rango (la línea que cruza
+    'end' se consume completa; la parcial inicial pertenece al chunk
+    anterior). Los contadores parciales se fusionan en el proceso padre —
+    la agregación es conmutativa, así que el resultado es idéntico al
+    recorrido secuencial.
+
+    Retorna:
+        Tupla (conteos por fecha, dict plano (fecha, usuario) -> conteo).
+    """
+    # Delegar al módulo compilado cuando está disponible (misma semántica)
+    if fast_agg is not None:
+        return fast_agg.scan_q1(file_path, start, end)
+
+    date_counts = Counter()
+
+    # Dict plano con clave (fecha, usuario): una sola tabla hash en lugar
+    # de un Counter por fecha — la mitad de lookups y mejor localidad
+    user_counts = {}
+
+    # mmap: las líneas se localizan con mm.find (memchr a velocidad C) y
+    # cada slice de bytes pasa directo a simdjson, sin el stack de io ni
+    # el buffering de readline por línea
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = mm.size()
+        if end > size:
+            end = size
+
+        pos = start
+        if start and mm[start - 1:start] != b'\n':
+            # Descartar la línea parcial: pertenece al chunk anterior.
+            # Si el rango empieza justo en un inicio de línea (el byte
+            # anterior es '\n'), la línea es de este chunk y se procesa
+            nl = mm.find(b'\n', pos)
+            pos = size if nl < 0 else nl + 1
+
+        while pos < end:
+            nl = mm.find(b'\n', pos)
+            if nl < 0:
+                nl = size
+            line = mm[pos:nl]
+            pos = nl + 1
+
+            tweet = None
+            try:
+                # Parseo lazy con simdjson: solo se indexa la estructura,
+                # sin materializar el dict completo del tweet
+                tweet = _parse(line)
+
+                # Indexación directa: los campos están presentes en la
+                # práctica totalidad de las líneas, y el except KeyError
+                # de abajo ya cubre la ausencia — sin cadena de .get ni
+                # dict vacío alocado por cada miss
+                # El campo date tiene formato ISO 8601 fijo: basta el
+                # prefijo 'YYYY-MM-DD' como clave de agregación, sin
+                # parseo de zona horaria ni objetos datetime
+                date_key = tweet['date'][:10]
+
+                # Validar la forma 'YYYY-MM-DD' del prefijo: una fecha
+                # mal formada no debe contar ni llegar a la conversión
+                # final (int()/date() lanzarían ValueError recién allí).
+                # isdecimal garantiza que int() acepte los dígitos
+                if (len(date_key) != 10
+                        or date_key[4] != '-' or date_key[7] != '-'
+                        or not date_key[:4].isdecimal()
+                        or not date_key[5:7].isdecimal()
+                        or not date_key[8:10].isdecimal()):
+                    continue
+
+                username = tweet['user']['username']
+                if not username:
+                    continue
+
+                # Actualizar contadores de agregación
+                date_counts[date_key] += 1
+                pair = (date_key, username)
+                user_counts[pair] = user_counts.get(pair, 0) + 1
+
+            except (ValueError, KeyError, TypeError):
+                # Se omiten líneas mal formadas
+                continue
+            finally:
+                # Liberar el proxy lazy antes del siguiente parse: el Parser
+                # reutiliza su buffer y exige que no queden vistas vivas
+                tweet = None
+
+    return date_counts, user_counts
+
+
+def q1_memory(file_path: str) -> List[Tuple[date, str]]:
     """
     Calcula las 10 fechas con mayor volumen de tweets junto con el usuario 
     más activo en cada fecha.
@@ -40,10 +182,13 @@ def q1_memory(file_path: str) -> List[Tuple[datetime.date, str]]:
     del tweet.
     
     Algoritmo:
-        1. Leer el archivo línea por línea para evitar cargar todo el dataset
-        2. Mantener un Counter para frecuencias por fecha
-        3. Mantener un Counter anidado para frecuencias de usuario por fecha
-        4. Extraer las 10 fechas principales y sus usuarios más activos
+        1. Dividir el archivo en rangos de bytes alineados a saltos de línea
+        2. Cada worker recorre su rango línea por línea y mantiene un
+           Counter por fecha (clave: prefijo 'YYYY-MM-DD' del string ISO)
+           más un dict plano (fecha, usuario) -> conteo
+        3. Fusionar los contadores parciales (merge conmutativo) en el padre
+        4. Extraer las 10 fechas principales, convertirlas a date y obtener
+           sus usuarios más activos
     
     Argumentos:
         file_path: Ruta al archivo JSON delimitado por líneas que contiene tweets
@@ -54,61 +199,73 @@ def q1_memory(file_path: str) -> List[Tuple[datetime.date, str]]:
         
     Excepciones:
         FileNotFoundError: Si la ruta especificada no existe
-        json.JSONDecodeError: Si falla el parseo de JSON (se omite con try/except)
-        
+        ValueError: Si falla el parseo de JSON (se omite con try/except)
+
     Notas Técnicas:
-        - Usa Counter para operaciones de incremento O(1)
-        - defaultdict(Counter) para estructura de conteo anidada
-        - Algoritmo de una sola pasada para máxima eficiencia en memoria
+        - Usa Counter para operaciones de incremento O(1) por fecha
+        - Los conteos por usuario viven en un único dict plano con clave
+          (fecha, usuario): evita asignar un Counter por cada fecha no
+          ganadora y reduce los lookups del hot loop a la mitad
+        - Una sola pasada total sobre el archivo, repartida entre workers;
+          solo los conteos agregados cruzan entre procesos
+        - simdjson parsea con índices estructurales SIMD y solo materializa
+          los campos accedidos ('date' y 'user.username'); el resto del
+          tweet nunca se convierte a objetos Python
+        - La fecha se agrega por el prefijo de 10 caracteres del string ISO:
+          los strings se hashean más rápido que los objetos date y se evita
+          construir (y descartar) un datetime por tweet; solo las ≤10
+          fechas ganadoras se convierten a date al final
         - Las líneas JSON mal formadas se omiten silenciosamente
     """
     
+    # Aceptar tanto str como Path: el fast path compilado tipa la ruta
+    # como str, y los workers reciben la ruta ya normalizada
+    file_path = os.fspath(file_path)
+
     # Inicializa las estructuras de datos para la agregación
     # Counter permite acceso O(1) e inicialización automática
     date_counts = Counter()
-    
-    # Estructura anidada: fecha -> {usuario: conteo}
-    date_user_counts = defaultdict(Counter)
-    
-    # Procesamiento en streaming: leer el archivo línea por línea
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                # Parsear línea JSON
-                tweet = json.loads(line)
-                
-                # Extraer fecha en forma de string
-                date_str = tweet.get('date', '')
-                if not date_str:
-                    continue
-                
-                # Parsear fecha ISO 8601 y extraer componente de fecha
-                # Soporta formatos 'Z' y '+00:00'
-                date_obj = datetime.fromisoformat(
-                    date_str.replace('Z', '+00:00')
-                ).date()
-                
-                # Extraer nombre de usuario
-                username = tweet.get('user', {}).get('username', '')
-                if not username:
-                    continue
-                
-                # Actualizar contadores de agregación
-                date_counts[date_obj] += 1
-                date_user_counts[date_obj][username] += 1
-                
-            except (json.JSONDecodeError, ValueError, KeyError):
-                # Se omiten líneas mal formadas
-                continue
-    
-    # Obtener las 10 fechas con mayor cantidad de tweets
-    top_10_dates = [date for date, _ in date_counts.most_common(10)]
-    
-    # Para cada fecha, obtener el usuario con más tweets
+
+    # Dict plano: (fecha, usuario) -> conteo
+    user_counts = {}
+
+    # Repartir el archivo en rangos de bytes, un worker por núcleo
+    bounds = _chunk_bounds(file_path, os.cpu_count() or 1)
+
+    # Archivo vacío: no hay rangos que repartir y Pool exige al menos
+    # un proceso — no hay nada que agregar
+    if not bounds:
+        return []
+
+    # Procesar los rangos en paralelo y fusionar los contadores parciales
+    with Pool(processes=len(bounds)) as pool:
+        partials = pool.starmap(
+            _scan_chunk,
+            [(file_path, start, end) for start, end in bounds]
+        )
+
+    for partial_dates, partial_users in partials:
+        # Counter.update suma conteos (merge conmutativo)
+        date_counts.update(partial_dates)
+        for pair, count in partial_users.items():
+            user_counts[pair] = user_counts.get(pair, 0) + count
+
+    # Obtener las 10 fechas con mayor cantidad de tweets: heap de tamaño
+    # 10, O(d log 10) en lugar de ordenar las d fechas completas
+    top_10_keys = [key for key, _ in nlargest(10, date_counts.items(), key=itemgetter(1))]
+
+    # Una sola pasada sobre el dict plano para encontrar el usuario más
+    # activo de cada fecha ganadora (sin ordenar usuarios por fecha)
+    best = {key: ('', -1) for key in top_10_keys}
+    for (date_key, username), count in user_counts.items():
+        entry = best.get(date_key)
+        if entry is not None and count > entry[1]:
+            best[date_key] = (username, count)
+
+    # Convertir solo las ≤10 claves ganadoras a objetos date
     result = []
-    for date_obj in top_10_dates:
-        # most_common(1) devuelve [(usuario, conteo)]
-        top_user = date_user_counts[date_obj].most_common(1)[0][0]
-        result.append((date_obj, top_user))
-    
+    for key in top_10_keys:
+        date_obj = date(int(key[0:4]), int(key[5:7]), int(key[8:10]))
+        result.append((date_obj, best[key][0]))
+
     return result
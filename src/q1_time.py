@@ -28,6 +28,8 @@ Referencias:
 from typing import List, Tuple
 from datetime import date
 
+from duckdb_session import get_connection
+
 
 def q1_time(file_path: str) -> List[Tuple[date, str]]:
     """
@@ -35,15 +37,15 @@ def q1_time(file_path: str) -> List[Tuple[date, str]]:
     más activo para cada fecha.
     
     Esta implementación aprovecha el motor SQL optimizado de DuckDB para un
-    procesamiento rápido de JSON. El enfoque utiliza funciones ventana para
-    identificar eficientemente al usuario principal por fecha en una sola
-    pasada de consulta.
-    
+    procesamiento rápido de JSON. El usuario principal por fecha se obtiene
+    con el agregado arg_max, que selecciona en streaming sin materializar
+    ni ordenar particiones de ventana.
+
     Algoritmo:
-        1. Parsear JSON y extraer los campos de fecha y usuario
+        1. Obtener la sesión compartida con la tabla 'tweets' ya parseada
         2. Agregar los tweets por fecha para identificar las 10 fechas con mayor volumen
-        3. Para cada fecha principal, usar ROW_NUMBER() para rankear usuarios
-        4. Retornar los pares (fecha-usuario) con rango 1
+        3. Contar tweets por (fecha, usuario) en las fechas ganadoras
+        4. Seleccionar el usuario principal por fecha con arg_max(username, cnt)
     
     Argumentos:
         file_path: Ruta del archivo JSON delimitado por líneas que contiene tweets
@@ -57,65 +59,52 @@ def q1_time(file_path: str) -> List[Tuple[date, str]]:
         duckdb.Error: Si falla el parseo JSON o la ejecución de SQL
         
     Notas Técnicas:
-        - Usa read_json_auto() de DuckDB para parseo optimizado de JSON
-        - CAST a DATE para una comparación correcta de fechas
-        - La función ventana ROW_NUMBER() evita subconsultas y mejora el rendimiento
+        - Consulta la tabla temporal 'tweets' de la sesión compartida
+          (ver duckdb_session.py): el JSON se parsea una sola vez aunque
+          se ejecuten las tres preguntas sobre el mismo archivo
+        - La fecha llega ya casteada a DATE desde la carga de la tabla
+        - arg_max es un agregado de una sola pasada: reemplaza a
+          ROW_NUMBER() OVER (PARTITION BY ...), que materializaba y
+          ordenaba una partición completa por fecha solo para quedarse
+          con la primera fila
     """
-    import duckdb
-    
-    # Inicializa conexión DuckDB en memoria
-    con = duckdb.connect(':memory:')
-    
-    # Consulta SQL optimizada usando CTEs para claridad y funciones ventana para rendimiento
-    query = f"""
-        WITH parsed AS (
-            -- Extraer y parsear fecha y usuario desde JSON
-            SELECT 
-                CAST(substr(date, 1, 10) AS DATE) as date,
-                json_extract_string(user, '$.username') as username
-            FROM read_json_auto('{file_path}', format='newline_delimited')
-        ),
-        date_counts AS (
+    # Sesión compartida: la tabla 'tweets' ya contiene fecha y username
+    con = get_connection(file_path)
+
+    # Consulta SQL optimizada usando CTEs para claridad y arg_max para el top por fecha
+    query = """
+        WITH date_counts AS (
             -- Identificar las 10 fechas con mayor volumen de tweets
-            SELECT 
-                date, 
+            SELECT
+                date,
                 COUNT(*) as total_tweets
-            FROM parsed
+            FROM tweets
             GROUP BY date
             ORDER BY total_tweets DESC
             LIMIT 10
         ),
         user_counts AS (
-            -- Rankear usuarios por actividad para cada fecha principal
-            SELECT 
+            -- Contar tweets por (fecha, usuario) en las fechas principales
+            SELECT
                 p.date,
                 p.username,
-                COUNT(*) as user_tweets,
-                ROW_NUMBER() OVER (
-                    PARTITION BY p.date 
-                    ORDER BY COUNT(*) DESC
-                ) as rank
-            FROM parsed p
+                COUNT(*) as user_tweets
+            FROM tweets p
             INNER JOIN date_counts dc ON p.date = dc.date
             GROUP BY p.date, p.username
         )
-        -- Seleccionar solo el usuario más activo por fecha
-        SELECT 
+        -- arg_max retorna el username de la fila con mayor user_tweets
+        -- por grupo, en una sola pasada y sin ordenar particiones
+        SELECT
             date,
-            username
+            arg_max(username, user_tweets) as username
         FROM user_counts
-        WHERE rank = 1
+        GROUP BY date
         ORDER BY date DESC
     """
     
-    # Ejecutar la consulta y obtener resultados como DataFrame
-    result_df = con.execute(query).fetchdf()
-    con.close()
-    
-    # Convertir DataFrame al formato de salida requerido
-    result = [
-        (row['date'], row['username']) 
-        for _, row in result_df.iterrows()
-    ]
-    
-    return result
+    # Ejecutar la consulta y obtener tuplas directamente: fetchall()
+    # retorna (datetime.date, str) sin pasar por un DataFrame ni
+    # construir una Series de pandas por fila. La conexión queda viva
+    # en el cache de la sesión compartida
+    return con.execute(query).fetchall()
